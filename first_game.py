@@ -3,108 +3,218 @@ A simple Snake game implemented using Pygame.
 
 This script defines a basic Snake game where the player controls a snake
 that moves around the screen to eat apples. The game ends if the snake
-collides with itself or the screen boundaries.
+collides with itself or the screen boundaries, or when it fills the screen.
 """
 
-from random import randrange
+from collections import deque
+from random import choice
 import sys
 from time import sleep
 import pygame
 from pygame.event import Event
 
+DIRECTION_VECTORS = {
+    "UP": (0, -1),
+    "DOWN": (0, 1),
+    "LEFT": (-1, 0),
+    "RIGHT": (1, 0),
+}
+
+OPPOSITE_DIRECTIONS = {
+    "UP": "DOWN",
+    "DOWN": "UP",
+    "LEFT": "RIGHT",
+    "RIGHT": "LEFT",
+}
+
+KEY_TO_DIRECTION = {
+    pygame.K_UP: "UP",
+    pygame.K_w: "UP",
+    pygame.K_DOWN: "DOWN",
+    pygame.K_s: "DOWN",
+    pygame.K_LEFT: "LEFT",
+    pygame.K_a: "LEFT",
+    pygame.K_RIGHT: "RIGHT",
+    pygame.K_d: "RIGHT",
+}
+
 
 class Snake:
     """
     Represents the snake in the game.
 
     Attributes:
-        head (pygame.Rect): The head of the snake.
+        body (deque[tuple[int, int]]): Positions of all segments, head first.
+        occupied (set[tuple[int, int]]): The same positions, for fast lookups.
+        free_cells (list[tuple[int, int]]): Grid cells not covered by the snake.
+        free_index (dict[tuple[int, int], int]): Index of each free cell in free_cells.
+        rect (pygame.Rect): Reusable rectangle for drawing a single segment.
         direction (str): The current direction of movement.
+        delta (tuple[int, int]): Per-move offset for the current direction.
         color (str): The color of the snake.
         size (int): The size of each snake segment.
         game (Game): The game instance the snake belongs to.
-        parts (list[pygame.Rect]): List of all segments forming the snake.
+        pending_growth (int): Number of upcoming moves that keep the tail.
+        vacated_cell (tuple[int, int] | None): Cell the tail left on the last step.
         min_move_delay (int): Minimum delay between movements.
         move_delay_step (int): Step by which movement delay decreases.
         move_delay (int): Current movement delay.
         last_move_time (int): Last recorded time of movement.
+        max_x (int): Width of the screen; the head must stay left of it.
+        max_y (int): Height of the screen; the head must stay above it.
     """
 
-    def __init__(self, game: "Game", position: pygame.Vector2 = None) -> None:
+    def __init__(self, game: "Game", position: tuple[int, int] = None) -> None:
         """
         Initializes the snake at a random position.
 
         Args:
             game (Game): The game instance the snake belongs to.
-            position (pygame.Vector2, optional): Starting position of the snake. Defaults to None.
+            position (tuple[int, int], optional): Starting position of the snake. Defaults to None.
         """
         self.game = game
         self.size = self.game.object_size
         if position is None:
             position = self.game.get_random_position()
-        self.head = pygame.Rect(position, (self.size, self.size))
+        self.body = deque([position])
+        self.occupied = set(self.body)
+        self.free_cells = [
+            cell for cell in self.game.grid_cells if cell not in self.occupied
+        ]
+        self.free_index = {cell: i for i, cell in enumerate(self.free_cells)}
+        self.rect = pygame.Rect(0, 0, self.size, self.size)
         self.direction = "RIGHT"
+        self.delta = (self.size, 0)
         self.color = "GREEN"
-        self.parts = [self.head]
+        self.pending_growth = 0
+        self.vacated_cell = None
         self.min_move_delay = 50
         self.move_delay_step = 5
         self.move_delay = 200
         self.last_move_time = pygame.time.get_ticks()
+        self.max_x = int(self.game.screen_size.x)
+        self.max_y = int(self.game.screen_size.y)
+
+    @property
+    def head(self) -> tuple[int, int]:
+        """
+        Returns the position of the snake's head.
+        """
+        return self.body[0]
+
+    @property
+    def length(self) -> int:
+        """
+        Returns the length of the snake, counting segments it has yet to grow.
+        """
+        return len(self.body) + self.pending_growth
 
-    def move(self) -> None:
+    def move(self, direction: str = None) -> bool:
         """
-        Moves the snake in current direction.
+        Moves the snake once its movement delay has passed.
+
+        Args:
+            direction (str, optional): Direction to turn to before moving. Defaults to None.
+
+        Returns:
+            bool: True if the snake moved, False otherwise.
         """
         current_time = pygame.time.get_ticks()
         if current_time - self.last_move_time <= self.move_delay:
-            return
+            return False
 
-        for i in range(len(self.parts) - 1, 0, -1):
-            self.parts[i].topleft = self.parts[i - 1].topleft
-
-        if self.direction == "UP":
-            self.head.y -= self.size
-        if self.direction == "DOWN":
-            self.head.y += self.size
-        if self.direction == "LEFT":
-            self.head.x -= self.size
-        if self.direction == "RIGHT":
-            self.head.x += self.size
         self.last_move_time = current_time
+        if direction is not None:
+            self.turn(direction)
+        self.step()
+        return True
+
+    def turn(self, direction: str) -> None:
+        """
+        Changes the direction of movement.
+
+        Args:
+            direction (str): The new direction.
+        """
+        dx, dy = DIRECTION_VECTORS[direction]
+        self.direction = direction
+        self.delta = (dx * self.size, dy * self.size)
+
+    def step(self) -> None:
+        """
+        Advances the snake by one cell and checks for collisions, regardless of timing.
+        """
+        x, y = self.body[0]
+        dx, dy = self.delta
+        new_head = (x + dx, y + dy)
+        if self.pending_growth:
+            self.pending_growth -= 1
+            self.vacated_cell = None
+        else:
+            tail = self.body.pop()
+            self.occupied.discard(tail)
+            self.release_cell(tail)
+            self.vacated_cell = tail
+        self.body.appendleft(new_head)
+        if new_head in self.occupied:
+            self.game.running = False
+        else:
+            self.occupied.add(new_head)
+            self.claim_cell(new_head)
         self.check_collision()
 
+    def release_cell(self, cell: tuple[int, int]) -> None:
+        """
+        Marks a grid cell as free.
+
+        Args:
+            cell (tuple[int, int]): The cell the snake has left.
+        """
+        self.free_index[cell] = len(self.free_cells)
+        self.free_cells.append(cell)
+
+    def claim_cell(self, cell: tuple[int, int]) -> None:
+        """
+        Removes a grid cell from the free cells by swapping it with the last one.
+
+        Args:
+            cell (tuple[int, int]): The cell the snake has entered.
+        """
+        index = self.free_index.pop(cell, None)
+        if index is None:
+            return
+        last = self.free_cells.pop()
+        if index < len(self.free_cells):
+            self.free_cells[index] = last
+            self.free_index[last] = index
+
     def check_collision(self) -> None:
         """
-        Checks for collision with apple, itself, or screen boundaries.
+        Checks for collision with apple or screen boundaries.
+
+        Eating the last apple with no free cell left ends the round as a win.
+
+        Collisions with itself are detected in step() through the occupied set.
         """
-        if (
-            any(self.head.colliderect(part) for part in self.parts[1:])
-            or self.head.x not in range(int(self.game.screen_size.x))
-            or self.head.y not in range(int(self.game.screen_size.y))
-        ):
+        head = self.body[0]
+        x, y = head
+        if x < 0 or x >= self.max_x or y < 0 or y >= self.max_y:
             self.game.running = False
-            print(any(self.head.colliderect(part) for part in self.parts[1:]))
 
-        if self.head.colliderect(self.game.apple.rect):
+        if head == self.game.apple.rect.topleft:
+            if not self.free_cells:
+                self.game.won = True
+                self.game.running = False
+                return
             self.grow()
             self.increase_speed()
             self.game.apple = Apple(self.game)
 
     def grow(self) -> None:
         """
-        Adds a new segment to the snake
+        Adds a new segment to the snake by keeping the tail on the next move.
         """
-        last_part = self.parts[-1]
-        new_part = pygame.Rect(last_part.topleft, (self.size, self.size))
-        if self.direction == "UP":
-            new_part.y += self.size
-        elif self.direction == "DOWN":
-            new_part.y -= self.size
-        elif self.direction == "LEFT":
-            new_part.x += self.size
-        elif self.direction == "RIGHT":
-            new_part.x -= self.size
-        self.parts.append(new_part)
+        self.pending_growth += 1
 
     def increase_speed(self):
         """
@@ -124,19 +234,16 @@ class Apple:
         rect (pygame.Rect): The rectangular area occupied by the apple.
     """
 
-    def __init__(self, game: "Game", old_position: pygame.Vector2 = None):
+    def __init__(self, game: "Game"):
         """
         Initializes an apple at a random position, ensuring it does not spawn on the snake.
 
+        The snake must leave at least one free cell.
+
         Args:
             game (Game): The game instance the apple belongs to.
-            old_position (pygame.Vector2, optional): The previous apple position. Defaults to None.
         """
-        new_position = game.get_random_position()
-        while new_position == old_position or any(
-            new_position == part.topleft for part in game.snake.parts[1:]
-        ):
-            new_position = game.get_random_position()
+        new_position = choice(game.snake.free_cells)
         self.color = "RED"
         self.rect = pygame.Rect(new_position, (game.object_size, game.object_size))
 
@@ -148,11 +255,22 @@ class Game:
     Attributes:
         screen_size (pygame.Vector2): The dimensions of the game window.
         object_size (int): The size of each object in the game.
+        cols (int): Number of grid columns on the screen.
+        rows (int): Number of grid rows on the screen.
+        grid_cells (tuple[tuple[int, int], ...]): Every cell position on the grid.
         screen (Surface): The Pygame window surface.
         clock (pygame.time.Clock): Controls the game speed.
         snake (Snake): The snake object.
         apple (Apple): The apple object.
         running (bool): Indicates if the game is currently running.
+        next_direction (str | None): Direction requested for the next snake move.
+        won (bool): Indicates if the last round ended with the screen filled.
+        score_font (pygame.font.Font): Font used to render the score.
+        score_surfaces (list[Surface]): Pre-rendered text for every possible score.
+        game_over_text (Surface): Pre-rendered "GAME OVER" text.
+        win_text (Surface): Pre-rendered "YOU WIN" text.
+        score_rect (pygame.Rect): Screen area covered by the drawn score.
+        drawn_score (int): Score currently shown on the screen.
     """
 
     def __init__(self) -> None:
@@ -163,116 +281,203 @@ class Game:
         self.display_flags = pygame.NOFRAME
         self.screen_size = pygame.Vector2(800, 600)
         self.object_size = 20
-        self.screen = pygame.display.set_mode(self.screen_size, self.display_flags)
+        self.cols = int(self.screen_size.x) // self.object_size
+        self.rows = int(self.screen_size.y) // self.object_size
+        self.grid_cells = tuple(
+            (x * self.object_size, y * self.object_size)
+            for x in range(self.cols)
+            for y in range(self.rows)
+        )
+        self.screen = pygame.display.set_mode(
+            self.screen_size, self.display_flags, vsync=1
+        )
         self.clock = pygame.time.Clock()
+        self.score_font = pygame.font.SysFont("cooperblack", 24)
+        self.score_surfaces = [
+            self.score_font.render(str(score), True, "WHITE")
+            for score in range(self.cols * self.rows + 1)
+        ]
+        self.game_over_text = pygame.font.SysFont("cooperblack", 64).render(
+            "GAME OVER", True, "WHITE"
+        )
+        self.win_text = pygame.font.SysFont("cooperblack", 64).render(
+            "YOU WIN", True, "WHITE"
+        )
+        self.score_rect = pygame.Rect(0, 0, 0, 0)
+        self.drawn_score = 0
         self.snake = Snake(game=self)
         self.apple = Apple(game=self)
         self.running = True
+        self.won = False
+        self.next_direction = None
+        self.redraw()
 
-    def get_random_position(self) -> pygame.Vector2:
+    def get_random_position(self) -> tuple[int, int]:
         """
         Generates a random position withing the screen grid.
 
         Returns:
-            pygame.Vector2: A valid position for game objects.
+            tuple[int, int]: A valid position for game objects.
         """
-        return pygame.Vector2(
-            randrange(int(self.screen_size.x // self.object_size)) * self.object_size,
-            randrange(int(self.screen_size.y // self.object_size)) * self.object_size,
-        )
+        return choice(self.grid_cells)
 
     def handle_input(self, events: list[Event]) -> None:
         """
-        Process player input to control the snake.
+        Process player input, remembering the latest valid turn for the next move.
 
         Args:
             events (list[Event]): List of Pygame events.
         """
-        key_to_direction = {
-            pygame.K_UP: "UP",
-            pygame.K_w: "UP",
-            pygame.K_DOWN: "DOWN",
-            pygame.K_s: "DOWN",
-            pygame.K_LEFT: "LEFT",
-            pygame.K_a: "LEFT",
-            pygame.K_RIGHT: "RIGHT",
-            pygame.K_d: "RIGHT",
-        }
         for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             if event.type == pygame.KEYDOWN:
-                if event.key in key_to_direction:
-                    new_direction = key_to_direction[event.key]
-                    if (
-                        (new_direction == "UP" and self.snake.direction != "DOWN")
-                        or (new_direction == "DOWN" and self.snake.direction != "UP")
-                        or (new_direction == "LEFT" and self.snake.direction != "RIGHT")
-                        or (new_direction == "RIGHT" and self.snake.direction != "LEFT")
+                new_direction = KEY_TO_DIRECTION.get(event.key)
+                if new_direction is not None:
+                    if new_direction != self.snake.direction and (
+                        OPPOSITE_DIRECTIONS[new_direction] != self.snake.direction
                     ):
-                        self.snake.direction = new_direction
+                        self.next_direction = new_direction
                 elif event.key == pygame.K_ESCAPE:
                     self.running = False
 
-    def get_score(self):
-        score = len(self.snake.parts)
-        score_text = pygame.font.SysFont("cooperblack", 24).render(
-            str(score), True, "WHITE"
-        )
-        return score_text
+    def get_score(self) -> pygame.Surface:
+        """
+        Returns the pre-rendered text for the current score.
 
-    def draw(self) -> None:
+        Returns:
+            Surface: The score text surface.
+        """
+        return self.score_surfaces[self.snake.length]
+
+    def draw_score(self) -> list[pygame.Rect]:
+        """
+        Blits the score text after repainting the cells under the old and new text.
+
+        Returns:
+            list[pygame.Rect]: The repainted areas.
+        """
+        score_text = self.get_score()
+        old_score_rect = self.score_rect
+        self.score_rect = score_text.get_rect(topleft=(10, 10))
+        self.drawn_score = self.snake.length
+        area = self.score_rect.union(old_score_rect)
+        dirty_rects = [self.draw_cell(cell) for cell in self.cells_in(area)]
+        self.screen.blit(score_text, self.score_rect)
+        return dirty_rects
+
+    def draw_cell(self, cell: tuple[int, int]) -> pygame.Rect:
+        """
+        Repaints a single grid cell with whatever currently occupies it.
+
+        Args:
+            cell (tuple[int, int]): Top-left position of the cell.
+
+        Returns:
+            pygame.Rect: The repainted area.
         """
-        Draws the game objects on the screen.
+        rect = pygame.Rect(cell, (self.object_size, self.object_size))
+        if cell in self.snake.occupied:
+            color = self.snake.color
+        elif cell == self.apple.rect.topleft:
+            color = self.apple.color
+        else:
+            color = "black"
+        self.screen.fill(color, rect)
+        return rect
+
+    def cells_in(self, area: pygame.Rect) -> list[tuple[int, int]]:
+        """
+        Lists the grid cells overlapping an area of the screen.
+
+        Args:
+            area (pygame.Rect): The screen area.
+
+        Returns:
+            list[tuple[int, int]]: Top-left positions of the overlapping cells.
+        """
+        size = self.object_size
+        return [
+            (x, y)
+            for x in range(area.left // size * size, area.right, size)
+            for y in range(area.top // size * size, area.bottom, size)
+        ]
+
+    def redraw(self) -> None:
+        """
+        Draws every game object on a cleared screen.
         """
         self.screen.fill("black")
-        self.screen.blit(self.get_score(), (10, 10))
-        for part in self.snake.parts:
-            pygame.draw.rect(self.screen, self.snake.color, part)
+        rect = self.snake.rect
+        for part in self.snake.body:
+            rect.topleft = part
+            pygame.draw.rect(self.screen, self.snake.color, rect)
         pygame.draw.rect(self.screen, self.apple.color, self.apple.rect)
+        self.draw_score()
         pygame.display.flip()
 
+    def draw(self) -> None:
+        """
+        Redraws only the cells a single snake step can change.
+        """
+        cells = [self.snake.head, self.apple.rect.topleft]
+        if self.snake.vacated_cell is not None:
+            cells.append(self.snake.vacated_cell)
+        dirty_rects = [self.draw_cell(cell) for cell in cells]
+        if (
+            self.snake.length != self.drawn_score
+            or self.score_rect.collidelist(dirty_rects) != -1
+        ):
+            dirty_rects.extend(self.draw_score())
+        pygame.display.update(dirty_rects)
+
+    def main_loop(self) -> None:
+        """
+        Alternates between playing and the Game Over screen until the player quits.
+        """
+        while True:
+            self.run()
+            self.game_over()
+
     def run(self) -> None:
         """
-        Runs the main game loop.
+        Runs the game loop until the snake dies or the player leaves the round.
         """
         while self.running:
             self.handle_input(events=pygame.event.get())
-            self.snake.move()
-            self.snake.check_collision()
-            self.draw()
+            if self.snake.move(self.next_direction):
+                self.next_direction = None
+                self.draw()
             self.clock.tick(60)
-        self.game_over()
 
     def game_over(self):
         """
-        Handles Game Over screen
+        Handles Game Over screen and returns once the player starts a new game.
         """
         self.screen = pygame.display.set_mode(self.screen_size)
-        game_over_text = pygame.font.SysFont("cooperblack", 64).render(
-            "GAME OVER", True, "WHITE"
-        )
+        game_over_text = self.win_text if self.won else self.game_over_text
         game_over_text_rect = game_over_text.get_rect(
             center=(self.screen_size.x / 2, self.screen_size.y / 2)
         )
         self.screen.blit(game_over_text, game_over_text_rect)
         pygame.display.flip()
         while not self.running:
-            events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                    self.screen = pygame.display.set_mode(
-                        self.screen_size, flags=self.display_flags
-                    )
-                    self.running = True
-                    self.snake = Snake(self)
-                    self.apple = Apple(self)
-        self.run()
+            event = pygame.event.wait()
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                self.screen = pygame.display.set_mode(
+                    self.screen_size, flags=self.display_flags, vsync=1
+                )
+                self.running = True
+                self.won = False
+                self.next_direction = None
+                self.snake = Snake(self)
+                self.apple = Apple(self)
+                self.redraw()
 
 
 if __name__ == "__main__":
     game_inst = Game()
-    game_inst.run()
+    game_inst.main_loop()